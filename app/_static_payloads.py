@@ -0,0 +1,43 @@
+"""Pre-serialized payloads shared by the app entry points.
+
+The root payload only changes on deploy, and main.py/main_simple.py were
+each rebuilding the same literal lists/dicts per request. Serialize once
+here and let both handlers return the bytes directly.
+"""
+
+import orjson
+from app.core.config import settings
+from app.core.versioning import version_manager
+
+ROOT_PAYLOAD_BYTES = orjson.dumps({
+    "message": "Multi-Service Automation Platform",
+    "version": settings.app_version,
+    "status": "running",
+    "api_version": version_manager.get_current_version(),
+    "supported_versions": version_manager.get_supported_versions(),
+    "features": [
+        "FastAPI Backend",
+        "Slack Integration",
+        "Telegram Integration",
+        "Google Sheets Integration",
+        "JWT Authentication",
+        "Role-Based Access Control (RBAC)",
+        "Rate Limiting",
+        "Redis Caching",
+        "WebSocket Support",
+        "Background Jobs (Celery)",
+        "API Versioning",
+        "Monitoring & Metrics",
+        "Admin Panel",
+        "Docker Support"
+    ],
+    "endpoints": {
+        "api_docs": "/docs",
+        "health": "/health",
+        "admin": "/api/v1/admin",
+        "auth": "/api/v1/auth",
+        "messages": "/api/v1/messages",
+        "sheets": "/api/v1/sheets",
+        "websocket": "/api/v1/ws/connect"
+    }
+})
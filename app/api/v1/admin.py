@@ -1,13 +1,15 @@
 """Admin panel API endpoints."""
 
+import asyncio
+from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
-from app.core.database import get_db
-from app.core.security import get_current_user
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy import case, desc, func
+from app.core.database import get_db, SessionLocal
+from app.api.v1.auth import get_current_user
 from app.core.rate_limiting import rate_limit
-from app.core.cache import cache
+from app.core.cache import cache, redis_client
 from app.core.monitoring import metrics, APIAnalytics
 from app.models.user import User
 from app.models.role import Role, Permission, UserSession
@@ -19,6 +21,9 @@ from app.core.exceptions import AuthorizationError
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+# Cache key for the system overview aggregates (global, non-PII)
+OVERVIEW_CACHE_KEY = "admin:stats:overview"
+
 
 def require_admin(current_user: User = Depends(get_current_user)) -> User:
     """Require admin privileges."""
@@ -34,30 +39,39 @@ async def get_system_overview(
     db: Session = Depends(get_db)
 ):
     """Get system overview statistics."""
-    
-    # Get user statistics
-    total_users = db.query(User).count()
-    active_users = db.query(User).filter(User.is_active == True).count()
-    verified_users = db.query(User).filter(User.is_verified == True).count()
-    
-    # Get recent registrations (last 30 days)
-    from datetime import datetime, timedelta
+
+    # Serve from cache; the aggregates barely move between dashboard polls
+    cached = await cache.get(OVERVIEW_CACHE_KEY)
+    if cached is not None:
+        return SystemStats(**cached)
+
     thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    recent_registrations = db.query(User).filter(
-        User.created_at >= thirty_days_ago
-    ).count()
-    
-    # Get service connection stats
-    slack_connected = db.query(User).filter(User.slack_connected == True).count()
-    telegram_connected = db.query(User).filter(User.telegram_connected == True).count()
-    sheets_connected = db.query(User).filter(User.google_sheets_connected == True).count()
-    
+
+    # Get all user statistics in a single scan of the users table
+    (
+        total_users,
+        active_users,
+        verified_users,
+        recent_registrations,
+        slack_connected,
+        telegram_connected,
+        sheets_connected,
+    ) = db.query(
+        func.count(User.id),
+        func.count(case((User.is_active == True, 1))),
+        func.count(case((User.is_verified == True, 1))),
+        func.count(case((User.created_at >= thirty_days_ago, 1))),
+        func.count(case((User.slack_connected == True, 1))),
+        func.count(case((User.telegram_connected == True, 1))),
+        func.count(case((User.google_sheets_connected == True, 1))),
+    ).one()
+
     # Get active sessions
-    active_sessions = db.query(UserSession).filter(
+    active_sessions = db.query(func.count(UserSession.id)).filter(
         UserSession.is_active == True
-    ).count()
+    ).scalar()
     
-    return SystemStats(
+    stats = SystemStats(
         users=UserStats(
             total=total_users,
             active=active_users,
@@ -73,46 +87,67 @@ async def get_system_overview(
         metrics=metrics.get_metrics()
     )
 
+    await cache.set(OVERVIEW_CACHE_KEY, stats.model_dump(), ttl=60)
+
+    return stats
+
 
 @router.get("/users", response_model=UserListResponse)
 @rate_limit(limit=20, window=60)
 async def list_users(
-    page: int = Query(1, ge=1),
+    cursor: Optional[int] = Query(None, ge=1, description="Last user id from the previous page"),
     size: int = Query(20, ge=1, le=100),
     search: Optional[str] = Query(None),
     is_active: Optional[bool] = Query(None),
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
-    """List users with pagination and filtering."""
-    
+    """List users with keyset pagination and filtering."""
+
     query = db.query(User)
-    
+
     # Apply filters
     if search:
-        query = query.filter(
-            (User.username.contains(search)) |
-            (User.email.contains(search)) |
-            (User.first_name.contains(search)) |
-            (User.last_name.contains(search))
-        )
-    
+        if db.get_bind().dialect.name == "postgresql":
+            # Trigram match over one concatenated expression, served by the
+            # users_search_trgm GIN index (scripts/create_users_search_index.sql).
+            # Must mirror the index DDL exactly — Postgres only uses an
+            # expression index when the query expression matches it
+            haystack = (
+                func.coalesce(User.username, "") + " " +
+                func.coalesce(User.email, "") + " " +
+                func.coalesce(User.first_name, "") + " " +
+                func.coalesce(User.last_name, "")
+            )
+            query = query.filter(haystack.op("%")(search))
+        else:
+            # SQLite (tests) has no pg_trgm; fall back to LIKE scans
+            query = query.filter(
+                (User.username.contains(search)) |
+                (User.email.contains(search)) |
+                (User.first_name.contains(search)) |
+                (User.last_name.contains(search))
+            )
+
     if is_active is not None:
         query = query.filter(User.is_active == is_active)
-    
-    # Get total count
-    total = query.count()
-    
-    # Apply pagination
-    offset = (page - 1) * size
-    users = query.offset(offset).limit(size).all()
-    
+
+    # Total is only computed on the first page; deeper pages seek by id
+    total = query.count() if cursor is None else None
+
+    # Seek past the cursor instead of OFFSET-scanning discarded rows
+    if cursor is not None:
+        query = query.filter(User.id > cursor)
+
+    rows = query.order_by(User.id).limit(size + 1).all()
+    users = rows[:size]
+    next_cursor = users[-1].id if len(rows) > size else None
+
     return UserListResponse(
         users=users,
         total=total,
-        page=page,
         size=size,
-        pages=(total + size - 1) // size
+        next_cursor=next_cursor
     )
 
 
@@ -124,24 +159,42 @@ async def get_user_details(
     db: Session = Depends(get_db)
 ):
     """Get detailed user information."""
-    
-    user = db.query(User).filter(User.id == user_id).first()
+
+    def _load_user():
+        # Eager-load roles and their permissions in batched IN queries;
+        # raiseload guards against new lazy-load regressions on this path
+        return db.query(User).options(
+            selectinload(User.roles).selectinload(Role.permissions),
+            raiseload("*"),
+        ).filter(User.id == user_id).first()
+
+    def _load_sessions():
+        # Use a separate pooled session so both lookups can run concurrently
+        session_db = SessionLocal()
+        try:
+            return session_db.query(UserSession).filter(
+                UserSession.user_id == user_id
+            ).order_by(desc(UserSession.created_at)).limit(10).all()
+        finally:
+            session_db.close()
+
+    user, sessions = await asyncio.gather(
+        asyncio.to_thread(_load_user),
+        asyncio.to_thread(_load_sessions),
+    )
+
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    
-    # Get user sessions
-    sessions = db.query(UserSession).filter(
-        UserSession.user_id == user_id
-    ).order_by(desc(UserSession.created_at)).limit(10).all()
-    
+
     return {
         "user": user,
         "sessions": sessions,
         "roles": user.roles,
-        "permissions": [p for role in user.roles for p in role.permissions]
+        # Dedup by id: the same permission can be granted via several roles
+        "permissions": list({p.id: p for role in user.roles for p in role.permissions}.values())
     }
 
 
@@ -171,8 +224,12 @@ async def list_roles(
     db: Session = Depends(get_db)
 ):
     """List all roles."""
-    
-    roles = db.query(Role).filter(Role.is_active == True).all()
+
+    # Load every role's permissions in one batched IN query instead of a
+    # lazy select per role during serialization
+    roles = db.query(Role).options(
+        selectinload(Role.permissions)
+    ).filter(Role.is_active == True).all()
     return roles
 
 
@@ -215,7 +272,10 @@ async def assign_role(
     if role not in user.roles:
         user.roles.append(role)
         db.commit()
-    
+        # Drop the memoized permission set; it was built pre-mutation
+        user.__dict__.pop("_perm_set", None)
+        await cache.delete(OVERVIEW_CACHE_KEY)
+
     return {"message": f"Role {role.name} assigned to user {user.username}"}
 
 
@@ -246,7 +306,10 @@ async def remove_role(
     if role in user.roles:
         user.roles.remove(role)
         db.commit()
-    
+        # Drop the memoized permission set; it was built pre-mutation
+        user.__dict__.pop("_perm_set", None)
+        await cache.delete(OVERVIEW_CACHE_KEY)
+
     return {"message": f"Role {role.name} removed from user {user.username}"}
 
 
@@ -274,7 +337,8 @@ async def deactivate_user(
     
     user.is_active = False
     db.commit()
-    
+    await cache.delete(OVERVIEW_CACHE_KEY)
+
     return {"message": f"User {user.username} deactivated"}
 
 
@@ -296,7 +360,8 @@ async def activate_user(
     
     user.is_active = True
     db.commit()
-    
+    await cache.delete(OVERVIEW_CACHE_KEY)
+
     return {"message": f"User {user.username} activated"}
 
 
@@ -308,9 +373,7 @@ async def get_cache_statistics(
     """Get cache statistics."""
     
     try:
-        from app.core.cache import redis_client
-        
-        info = redis_client.info()
+        info = await redis_client.info()
         
         return {
             "memory_used": info.get("used_memory_human"),
@@ -3,10 +3,11 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from app.core.database import get_db
 from app.core.security import verify_password, create_access_token, verify_token, get_token_exception
 from app.models.user import User
+from app.models.role import Role
 from app.schemas.user import UserCreate, UserResponse, Token, UserLogin
 from app.core.config import settings
 
@@ -32,8 +33,13 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
     email = verify_token(token)
     if email is None:
         raise get_token_exception()
-    
-    user = get_user_by_email(db, email)
+
+    # Eager-load roles and their permissions: has_role/has_permission
+    # checks run on most protected routes, and lazy loading here costs
+    # two extra queries per request
+    user = db.query(User).options(
+        selectinload(User.roles).selectinload(Role.permissions)
+    ).filter(User.email == email).first()
     if user is None:
         raise get_token_exception()
     return user
@@ -1,9 +1,8 @@
 """Message sending routes for unified communication."""
 
+import asyncio
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from app.models.user import User
 from app.api.v1.auth import get_current_user
 from app.schemas.message import (
@@ -13,28 +12,41 @@ from app.schemas.message import (
     SlackMessage,
     TelegramMessage
 )
-from services.slack_service import SlackService
-from services.telegram_service import TelegramService
+from services.slack_service import SlackService, slack_service
+from services.telegram_service import TelegramService, telegram_service
 
 router = APIRouter(prefix="/messages", tags=["messages"])
 
 
+def get_slack_service(request: Request) -> SlackService:
+    """Get the shared Slack service from app state."""
+    service = getattr(request.app.state, "slack_service", None)
+    if service is None:
+        service = request.app.state.slack_service = slack_service
+    return service
+
+
+def get_telegram_service(request: Request) -> TelegramService:
+    """Get the shared Telegram service from app state."""
+    service = getattr(request.app.state, "telegram_service", None)
+    if service is None:
+        service = request.app.state.telegram_service = telegram_service
+    return service
+
+
 @router.post("/send", response_model=UnifiedMessageResponse)
 async def send_unified_message(
     message: UnifiedMessage,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    slack_service: SlackService = Depends(get_slack_service),
+    telegram_service: TelegramService = Depends(get_telegram_service)
 ):
     """Send message to multiple services simultaneously."""
     results = []
-    total_sent = 0
-    total_failed = 0
-    
-    # Initialize services
-    slack_service = SlackService()
-    telegram_service = TelegramService()
-    
-    # Send to Slack
+    task_services = []
+    tasks = []
+
+    # Collect one send coroutine per requested service
     if "slack" in message.services:
         if not message.slack_channel:
             results.append(MessageResponse(
@@ -42,27 +54,14 @@ async def send_unified_message(
                 service="slack",
                 error="Slack channel not specified"
             ))
-            total_failed += 1
         else:
-            slack_result = await slack_service.send_message(
+            task_services.append("slack")
+            tasks.append(slack_service.send_message(
                 channel=message.slack_channel,
                 text=message.content,
                 thread_ts=message.thread_ts
-            )
-            
-            results.append(MessageResponse(
-                success=slack_result["success"],
-                service="slack",
-                message_id=slack_result.get("message_id"),
-                error=slack_result.get("error")
             ))
-            
-            if slack_result["success"]:
-                total_sent += 1
-            else:
-                total_failed += 1
-    
-    # Send to Telegram
+
     if "telegram" in message.services:
         if not message.telegram_chat_id:
             results.append(MessageResponse(
@@ -70,26 +69,36 @@ async def send_unified_message(
                 service="telegram",
                 error="Telegram chat ID not specified"
             ))
-            total_failed += 1
         else:
-            telegram_result = await telegram_service.send_message(
+            task_services.append("telegram")
+            tasks.append(telegram_service.send_message(
                 chat_id=message.telegram_chat_id,
                 text=message.content,
                 reply_to_message_id=message.reply_to_message_id
-            )
-            
+            ))
+
+    # Dispatch all sends concurrently; latency is the slowest provider,
+    # and one provider blowing up must not lose the other's result
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True) if tasks else []
+
+    for service_name, outcome in zip(task_services, outcomes):
+        if isinstance(outcome, BaseException):
             results.append(MessageResponse(
-                success=telegram_result["success"],
-                service="telegram",
-                message_id=telegram_result.get("message_id"),
-                error=telegram_result.get("error")
+                success=False,
+                service=service_name,
+                error=str(outcome)
             ))
-            
-            if telegram_result["success"]:
-                total_sent += 1
-            else:
-                total_failed += 1
-    
+            continue
+        results.append(MessageResponse(
+            success=outcome["success"],
+            service=service_name,
+            message_id=outcome.get("message_id"),
+            error=outcome.get("error")
+        ))
+
+    total_sent = sum(1 for r in results if r.success)
+    total_failed = len(results) - total_sent
+
     return UnifiedMessageResponse(
         success=total_failed == 0,
         results=results,
@@ -101,11 +110,10 @@ async def send_unified_message(
 @router.post("/slack", response_model=MessageResponse)
 async def send_slack_message(
     message: SlackMessage,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    slack_service: SlackService = Depends(get_slack_service)
 ):
     """Send message to Slack only."""
-    slack_service = SlackService()
-    
     result = await slack_service.send_message(
         channel=message.channel,
         text=message.content,
@@ -123,11 +131,10 @@ async def send_slack_message(
 @router.post("/telegram", response_model=MessageResponse)
 async def send_telegram_message(
     message: TelegramMessage,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    telegram_service: TelegramService = Depends(get_telegram_service)
 ):
     """Send message to Telegram only."""
-    telegram_service = TelegramService()
-    
     result = await telegram_service.send_message(
         chat_id=message.chat_id,
         text=message.content,
@@ -144,9 +151,11 @@ async def send_telegram_message(
 
 
 @router.get("/slack/channels")
-async def list_slack_channels(current_user: User = Depends(get_current_user)):
+async def list_slack_channels(
+    current_user: User = Depends(get_current_user),
+    slack_service: SlackService = Depends(get_slack_service)
+):
     """List available Slack channels."""
-    slack_service = SlackService()
     result = await slack_service.list_channels()
     
     if not result["success"]:
@@ -159,9 +168,11 @@ async def list_slack_channels(current_user: User = Depends(get_current_user)):
 
 
 @router.get("/telegram/webhook-info")
-async def get_telegram_webhook_info(current_user: User = Depends(get_current_user)):
+async def get_telegram_webhook_info(
+    current_user: User = Depends(get_current_user),
+    telegram_service: TelegramService = Depends(get_telegram_service)
+):
     """Get Telegram webhook information."""
-    telegram_service = TelegramService()
     result = await telegram_service.get_webhook_info()
     
     if not result["success"]:
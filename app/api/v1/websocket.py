@@ -1,9 +1,12 @@
 """WebSocket endpoints for real-time updates."""
 
+import asyncio
 import json
 import logging
+import orjson
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Set
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from app.core.database import get_db
 from sqlalchemy.orm import Session
@@ -16,33 +19,58 @@ router = APIRouter(prefix="/ws", tags=["websocket"])
 # Store active connections
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
+        # A user may hold several sockets (multiple tabs/devices)
+        self.active_connections: Dict[str, Set[WebSocket]] = defaultdict(set)
 
     async def connect(self, websocket: WebSocket, user_id: str):
         await websocket.accept()
-        self.active_connections[user_id] = websocket
+        self.active_connections[user_id].add(websocket)
         logger.info(f"User {user_id} connected via WebSocket")
 
-    def disconnect(self, user_id: str):
-        if user_id in self.active_connections:
+    def disconnect(self, user_id: str, websocket: Optional[WebSocket] = None):
+        connections = self.active_connections.get(user_id)
+        if connections is None:
+            return
+        if websocket is None:
+            connections.clear()
+        else:
+            connections.discard(websocket)
+        if not connections:
             del self.active_connections[user_id]
             logger.info(f"User {user_id} disconnected from WebSocket")
 
     async def send_personal_message(self, message: Dict[str, Any], user_id: str):
-        if user_id in self.active_connections:
-            try:
-                await self.active_connections[user_id].send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error sending message to user {user_id}: {str(e)}")
-                self.disconnect(user_id)
+        targets = list(self.active_connections.get(user_id, ()))
+        if not targets:
+            return
+        payload = orjson.dumps(message)
+        results = await asyncio.gather(
+            *(connection.send_bytes(payload) for connection in targets),
+            return_exceptions=True
+        )
+        for connection, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending message to user {user_id}: {str(result)}")
+                self.disconnect(user_id, connection)
 
     async def broadcast(self, message: Dict[str, Any]):
-        for user_id, connection in self.active_connections.items():
-            try:
-                await connection.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error broadcasting to user {user_id}: {str(e)}")
-                self.disconnect(user_id)
+        # Serialize once; every connection receives the same bytes
+        payload = orjson.dumps(message)
+        # Snapshot the connections, then fan out concurrently so one slow
+        # client cannot stall the broadcast for everyone else
+        targets = [
+            (user_id, connection)
+            for user_id, connections in list(self.active_connections.items())
+            for connection in list(connections)
+        ]
+        results = await asyncio.gather(
+            *(connection.send_bytes(payload) for _, connection in targets),
+            return_exceptions=True
+        )
+        for (user_id, connection), result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error broadcasting to user {user_id}: {str(result)}")
+                self.disconnect(user_id, connection)
 
 manager = ConnectionManager()
 
@@ -95,10 +123,10 @@ async def websocket_endpoint(websocket: WebSocket, token: str = None):
                     }, str(user.id))
                 
         except WebSocketDisconnect:
-            manager.disconnect(str(user.id))
+            manager.disconnect(str(user.id), websocket)
         except Exception as e:
             logger.error(f"WebSocket error for user {user.id}: {str(e)}")
-            manager.disconnect(str(user.id))
+            manager.disconnect(str(user.id), websocket)
     
     finally:
         db.close()
@@ -111,7 +139,7 @@ async def send_message_update(user_id: str, service: str, message_data: Dict[str
         "type": "message_update",
         "service": service,
         "data": message_data,
-        "timestamp": str(datetime.utcnow())
+        "timestamp": datetime.utcnow().isoformat()
     }, user_id)
 
 
@@ -120,14 +148,15 @@ async def send_sheet_update(user_id: str, sheet_data: Dict[str, Any]):
     await manager.send_personal_message({
         "type": "sheet_update",
         "data": sheet_data,
-        "timestamp": str(datetime.utcnow())
+        "timestamp": datetime.utcnow().isoformat()
     }, user_id)
 
 
 async def broadcast_system_update(update_data: Dict[str, Any]):
     """Broadcast system update to all connected users."""
+    # One timestamp for the whole broadcast; serialization happens once too
     await manager.broadcast({
         "type": "system_update",
         "data": update_data,
-        "timestamp": str(datetime.utcnow())
+        "timestamp": datetime.utcnow().isoformat()
     })
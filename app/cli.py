@@ -0,0 +1,31 @@
+"""Management commands run out-of-band from the web workers.
+
+Usage:
+    python -m app.cli init-db
+"""
+
+import argparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def init_db():
+    """Create database tables (idempotent)."""
+    from app.core.database import create_tables
+    create_tables()
+    logger.info("Database tables created")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Management commands")
+    parser.add_argument("command", choices=["init-db"])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == "init-db":
+        init_db()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,19 @@
 """Caching utilities using Redis."""
 
-import json
-import pickle
-from typing import Any, Optional, Union
+import asyncio
+import hashlib
+import orjson
+from typing import Any, Dict, List, Optional, Union
 from datetime import timedelta
 from app.core.config import settings
-import redis
+import redis.asyncio as aioredis
 
-# Redis connection for caching
-redis_client = redis.from_url(settings.redis_url, decode_responses=False)
+# Async Redis connection for caching; operations never block the event loop
+redis_client = aioredis.from_url(
+    settings.redis_url,
+    decode_responses=False,
+    max_connections=50
+)
 
 class CacheManager:
     """Redis-based cache manager with serialization support."""
@@ -33,17 +38,12 @@ class CacheManager:
             Cached value or None if not found
         """
         try:
-            value = self.redis.get(key)
+            value = await self.redis.get(key)
             if value is None:
                 return None
             
             if deserialize:
-                try:
-                    # Try JSON first
-                    return json.loads(value.decode('utf-8'))
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    # Fall back to pickle
-                    return pickle.loads(value)
+                return orjson.loads(value)
             else:
                 return value.decode('utf-8')
                 
@@ -72,17 +72,18 @@ class CacheManager:
         """
         try:
             if serialize:
-                try:
-                    # Try JSON first
-                    serialized_value = json.dumps(value, default=str)
-                except (TypeError, ValueError):
-                    # Fall back to pickle
-                    serialized_value = pickle.dumps(value)
+                # orjson handles datetime/UUID natively; str() covers the rest.
+                # No pickle fallback: unpickling cached bytes is an RCE risk.
+                serialized_value = orjson.dumps(
+                    value,
+                    default=str,
+                    option=orjson.OPT_NON_STR_KEYS
+                )
             else:
                 serialized_value = str(value).encode('utf-8')
             
             ttl = ttl or self.default_ttl
-            return self.redis.setex(key, ttl, serialized_value)
+            return await self.redis.setex(key, ttl, serialized_value)
             
         except Exception as e:
             print(f"Cache set error: {e}")
@@ -91,7 +92,7 @@ class CacheManager:
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
         try:
-            return bool(self.redis.delete(key))
+            return bool(await self.redis.delete(key))
         except Exception as e:
             print(f"Cache delete error: {e}")
             return False
@@ -99,18 +100,60 @@ class CacheManager:
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         try:
-            return bool(self.redis.exists(key))
+            return bool(await self.redis.exists(key))
         except Exception as e:
             print(f"Cache exists error: {e}")
             return False
     
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple keys in a single round-trip."""
+        try:
+            values = await self.redis.mget(keys)
+            return [
+                orjson.loads(value) if value is not None else None
+                for value in values
+            ]
+        except Exception as e:
+            print(f"Cache mget error: {e}")
+            return [None] * len(keys)
+
+    async def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set multiple keys in a single pipelined round-trip."""
+        try:
+            ttl = ttl or self.default_ttl
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.setex(
+                        key,
+                        ttl,
+                        orjson.dumps(
+                            value,
+                            default=str,
+                            option=orjson.OPT_NON_STR_KEYS
+                        )
+                    )
+                await pipe.execute()
+            return True
+        except Exception as e:
+            print(f"Cache mset error: {e}")
+            return False
+
     async def clear_pattern(self, pattern: str) -> int:
         """Clear all keys matching pattern."""
         try:
-            keys = self.redis.keys(pattern)
-            if keys:
-                return self.redis.delete(*keys)
-            return 0
+            # SCAN walks the keyspace incrementally instead of blocking the
+            # whole Redis instance like KEYS; UNLINK frees memory off-thread
+            total = 0
+            cursor = 0
+            while True:
+                cursor, keys = await self.redis.scan(
+                    cursor, match=pattern, count=500
+                )
+                if keys:
+                    total += await self.redis.unlink(*keys)
+                if cursor == 0:
+                    break
+            return total
         except Exception as e:
             print(f"Cache clear pattern error: {e}")
             return 0
@@ -138,8 +181,35 @@ class CacheManager:
         value = await self.get(key)
         if value is not None:
             return value
-        
-        # Value not in cache, generate it
+
+        # Single-flight: when a hot key expires, only the worker holding the
+        # lock regenerates; everyone else polls for the fresh value instead
+        # of stampeding the backing store.
+        lock_key = f"lock:{key}"
+        try:
+            got_lock = await self.redis.set(lock_key, "1", nx=True, px=5000)
+        except Exception as e:
+            print(f"Cache lock error: {e}")
+            got_lock = True
+
+        if got_lock:
+            try:
+                value = await factory_func(*args, **kwargs)
+                await self.set(key, value, ttl)
+                return value
+            finally:
+                await self.delete(lock_key)
+
+        # Another worker is regenerating; poll with backoff, then fall back
+        # to computing ourselves so a crashed lock holder cannot wedge us
+        delay = 0.01
+        while delay <= 0.5:
+            await asyncio.sleep(delay)
+            value = await self.get(key)
+            if value is not None:
+                return value
+            delay *= 2
+
         value = await factory_func(*args, **kwargs)
         await self.set(key, value, ttl)
         return value
@@ -153,8 +223,16 @@ def cache_result(ttl: int = 3600, key_prefix: str = ""):
     """Decorator to cache function results."""
     def decorator(func):
         async def wrapper(*args, **kwargs):
-            # Generate cache key
-            cache_key = f"{key_prefix}:{func.__name__}:{hash(str(args) + str(kwargs))}"
+            # Stable key: Python's hash() is seeded per process, so workers
+            # would never share entries. BLAKE2b over a canonical payload
+            # makes every worker converge on the same key.
+            payload = orjson.dumps(
+                {"a": args, "k": kwargs},
+                default=str,
+                option=orjson.OPT_SORT_KEYS
+            )
+            digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+            cache_key = f"{key_prefix}:{func.__module__}.{func.__qualname__}:{digest}"
             
             # Try to get from cache
             result = await cache.get(cache_key)
@@ -23,6 +23,7 @@ celery_app.conf.update(
     task_soft_time_limit=25 * 60,  # 25 minutes
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
+    task_compression="gzip",  # keep large message payloads off the broker wire
 )
 
 # Optional: Configure periodic tasks
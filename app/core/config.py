@@ -1,62 +1,73 @@
 """Application configuration management using Pydantic settings."""
 
-from typing import List, Optional
-from pydantic import BaseSettings, Field
-from pydantic_settings import BaseSettings as PydanticBaseSettings
+from functools import lru_cache
+from typing import List
 
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-class Settings(PydanticBaseSettings):
+
+class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
-    
+
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
+
     # Database Configuration
-    database_url: str = Field(..., env="DATABASE_URL")
-    database_test_url: str = Field(..., env="DATABASE_TEST_URL")
-    
+    database_url: str
+    database_test_url: str
+
     # JWT Configuration
-    secret_key: str = Field(..., env="SECRET_KEY")
-    algorithm: str = Field(default="HS256", env="ALGORITHM")
-    access_token_expire_minutes: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
-    
+    secret_key: str
+    algorithm: str = "HS256"
+    access_token_expire_minutes: int = 30
+
     # Redis Configuration
-    redis_url: str = Field(..., env="REDIS_URL")
-    
+    redis_url: str
+
     # Slack Configuration
-    slack_bot_token: str = Field(..., env="SLACK_BOT_TOKEN")
-    slack_signing_secret: str = Field(..., env="SLACK_SIGNING_SECRET")
-    slack_app_token: str = Field(..., env="SLACK_APP_TOKEN")
-    
+    slack_bot_token: str
+    slack_signing_secret: str
+    slack_app_token: str
+
     # Telegram Configuration
-    telegram_bot_token: str = Field(..., env="TELEGRAM_BOT_TOKEN")
-    telegram_webhook_url: str = Field(..., env="TELEGRAM_WEBHOOK_URL")
-    
+    telegram_bot_token: str
+    telegram_webhook_url: str
+
     # Google Sheets Configuration
-    google_credentials_file: str = Field(..., env="GOOGLE_CREDENTIALS_FILE")
+    google_credentials_file: str
     google_sheets_scopes: List[str] = Field(
-        default=["https://www.googleapis.com/auth/spreadsheets"],
-        env="GOOGLE_SHEETS_SCOPES"
+        default=["https://www.googleapis.com/auth/spreadsheets"]
     )
-    
+    # Pace Sheets traffic under the per-minute API quotas (per user)
+    sheets_writes_per_min: int = 60
+    sheets_reads_per_min: int = 300
+
     # Application Configuration
-    app_name: str = Field(default="Multi-Service Automation Platform", env="APP_NAME")
-    app_version: str = Field(default="0.1.0", env="APP_VERSION")
-    debug: bool = Field(default=False, env="DEBUG")
-    host: str = Field(default="0.0.0.0", env="HOST")
-    port: int = Field(default=8000, env="PORT")
-    
+    app_name: str = "Multi-Service Automation Platform"
+    app_version: str = "0.1.0"
+    debug: bool = False
+    host: str = "0.0.0.0"
+    port: int = 8000
+
     # CORS Configuration
     allowed_origins: List[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8080"],
-        env="ALLOWED_ORIGINS"
+        default=["http://localhost:3000", "http://localhost:8080"]
     )
-    
+
     # Logging Configuration
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    log_format: str = Field(default="json", env="LOG_FORMAT")
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    log_level: str = "INFO"
+    log_format: str = "json"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance.
+
+    Parsed once per process; usable directly or as a FastAPI dependency,
+    which lets tests swap configuration via dependency overrides.
+    """
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -6,12 +6,17 @@ from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
 # Create database engine
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=settings.debug
-)
+# Default pool (size 5) exhausts under ~100 concurrent requests; size the
+# pool explicitly. SQLite (tests) rejects these arguments, so skip them there.
+engine_kwargs = {
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+    "echo": settings.debug,
+}
+if not settings.database_url.startswith("sqlite"):
+    engine_kwargs.update(pool_size=20, max_overflow=10, pool_timeout=30)
+
+engine = create_engine(settings.database_url, **engine_kwargs)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -1,12 +1,29 @@
 """Custom exceptions and error handling."""
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from fastapi import HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+
+# Shared empty details for default-message exceptions; immutable so a
+# cached instance cannot be mutated by one handler and leak into another
+_NO_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+# Status codes bound once at import; raising then costs one global lookup
+# instead of resolving the attribute off the status module per call
+_401 = status.HTTP_401_UNAUTHORIZED
+_403 = status.HTTP_403_FORBIDDEN
+_404 = status.HTTP_404_NOT_FOUND
+_409 = status.HTTP_409_CONFLICT
+_422 = status.HTTP_422_UNPROCESSABLE_ENTITY
+_429 = status.HTTP_429_TOO_MANY_REQUESTS
+_502 = status.HTTP_502_BAD_GATEWAY
+_503 = status.HTTP_503_SERVICE_UNAVAILABLE
+
 
 class BaseAPIException(Exception):
     """Base exception for API errors."""
-    
+
     def __init__(
         self,
         message: str,
@@ -15,7 +32,7 @@ class BaseAPIException(Exception):
     ):
         self.message = message
         self.status_code = status_code
-        self.details = details or {}
+        self.details = details if details is not None else _NO_DETAILS
         super().__init__(self.message)
 
 
@@ -25,7 +42,7 @@ class ValidationError(BaseAPIException):
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status_code=_422,
             details=details
         )
 
@@ -36,7 +53,7 @@ class AuthenticationError(BaseAPIException):
     def __init__(self, message: str = "Authentication failed"):
         super().__init__(
             message=message,
-            status_code=status.HTTP_401_UNAUTHORIZED
+            status_code=_401
         )
 
 
@@ -46,7 +63,7 @@ class AuthorizationError(BaseAPIException):
     def __init__(self, message: str = "Insufficient permissions"):
         super().__init__(
             message=message,
-            status_code=status.HTTP_403_FORBIDDEN
+            status_code=_403
         )
 
 
@@ -56,7 +73,7 @@ class NotFoundError(BaseAPIException):
     def __init__(self, message: str = "Resource not found"):
         super().__init__(
             message=message,
-            status_code=status.HTTP_404_NOT_FOUND
+            status_code=_404
         )
 
 
@@ -66,7 +83,7 @@ class ConflictError(BaseAPIException):
     def __init__(self, message: str = "Resource conflict"):
         super().__init__(
             message=message,
-            status_code=status.HTTP_409_CONFLICT
+            status_code=_409
         )
 
 
@@ -76,7 +93,7 @@ class RateLimitError(BaseAPIException):
     def __init__(self, message: str = "Rate limit exceeded"):
         super().__init__(
             message=message,
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS
+            status_code=_429
         )
 
 
@@ -86,7 +103,7 @@ class ServiceUnavailableError(BaseAPIException):
     def __init__(self, message: str = "Service temporarily unavailable"):
         super().__init__(
             message=message,
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+            status_code=_503
         )
 
 
@@ -96,7 +113,7 @@ class ExternalServiceError(BaseAPIException):
     def __init__(self, service: str, message: str):
         super().__init__(
             message=f"External service error ({service}): {message}",
-            status_code=status.HTTP_502_BAD_GATEWAY,
+            status_code=_502,
             details={"service": service}
         )
 
@@ -104,28 +121,27 @@ class ExternalServiceError(BaseAPIException):
 def create_error_response(
     exception: BaseAPIException,
     request_id: Optional[str] = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create standardized error response."""
-    
-    error_data = {
-        "error": {
-            "type": exception.__class__.__name__,
-            "message": exception.message,
-            "status_code": exception.status_code,
-            "details": exception.details
-        }
-    }
-    
-    if request_id:
-        error_data["error"]["request_id"] = request_id
-    
-    return JSONResponse(
+
+    # One dict literal, request_id included conditionally instead of a
+    # post-hoc mutation; details is copied to a plain dict because orjson
+    # cannot serialize the shared empty-details mapping proxy
+    return ORJSONResponse(
         status_code=exception.status_code,
-        content=error_data
+        content={
+            "error": {
+                "type": exception.__class__.__name__,
+                "message": exception.message,
+                "status_code": exception.status_code,
+                "details": dict(exception.details) if exception.details else {},
+                **({"request_id": request_id} if request_id else {})
+            }
+        }
     )
 
 
-def handle_validation_error(exc: Exception) -> JSONResponse:
+def handle_validation_error(exc: Exception) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
     if hasattr(exc, 'errors'):
         errors = []
@@ -136,8 +152,8 @@ def handle_validation_error(exc: Exception) -> JSONResponse:
                 "type": error["type"]
             })
         
-        return JSONResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        return ORJSONResponse(
+            status_code=_422,
             content={
                 "error": {
                     "type": "ValidationError",
@@ -148,8 +164,8 @@ def handle_validation_error(exc: Exception) -> JSONResponse:
             }
         )
     
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+    return ORJSONResponse(
+        status_code=_422,
         content={
             "error": {
                 "type": "ValidationError",
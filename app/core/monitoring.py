@@ -1,51 +1,84 @@
 """Monitoring and metrics utilities."""
 
+import asyncio
+import functools
 import time
 import logging
+from sqlalchemy import text
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 from fastapi import Request, Response
-from app.core.config import settings
 from app.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=4096)
+def _build_key(prefix: str, name: str, tag_items: tuple) -> str:
+    """Build (and memoize) a metric key for a name + tag combination.
+
+    The hot combinations — (endpoint, method, status) from the request
+    middleware — repeat constantly, so caching replaces per-call string
+    building with a single dict lookup.
+    """
+    key = f"{prefix}:{name}"
+    if tag_items:
+        key += ":" + ":".join(f"{k}={v}" for k, v in tag_items)
+    return key
+
+
 class MetricsCollector:
-    """Collects and stores application metrics."""
-    
-    def __init__(self):
+    """Collects and stores application metrics.
+
+    The key space is bounded: once max_keys distinct metrics exist, the
+    oldest key is evicted before a new one is admitted, so unexpected tag
+    cardinality degrades metrics instead of leaking memory.
+    """
+
+    def __init__(self, max_keys: int = 10_000):
         self.metrics = {}
-    
+        self.max_keys = max_keys
+
+    def _admit(self, key: str):
+        """Make room for a new key, evicting the oldest if at capacity."""
+        if key not in self.metrics and len(self.metrics) >= self.max_keys:
+            del self.metrics[next(iter(self.metrics))]
+
     def increment_counter(self, name: str, value: int = 1, tags: Optional[Dict[str, str]] = None):
         """Increment a counter metric."""
-        key = f"counter:{name}"
-        if tags:
-            key += ":" + ":".join(f"{k}={v}" for k, v in tags.items())
-        
+        key = _build_key("counter", name, tuple(sorted(tags.items())) if tags else ())
+
+        self._admit(key)
         self.metrics[key] = self.metrics.get(key, 0) + value
-        logger.info(f"Metric: {key} = {self.metrics[key]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Metric: %s = %s", key, self.metrics[key])
     
     def set_gauge(self, name: str, value: float, tags: Optional[Dict[str, str]] = None):
         """Set a gauge metric."""
-        key = f"gauge:{name}"
-        if tags:
-            key += ":" + ":".join(f"{k}={v}" for k, v in tags.items())
-        
+        key = _build_key("gauge", name, tuple(sorted(tags.items())) if tags else ())
+
+        self._admit(key)
         self.metrics[key] = value
-        logger.info(f"Metric: {key} = {value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Metric: %s = %s", key, value)
     
-    def record_timing(self, name: str, duration: float, tags: Optional[Dict[str, str]] = None):
-        """Record a timing metric."""
-        key = f"timer:{name}"
-        if tags:
-            key += ":" + ":".join(f"{k}={v}" for k, v in tags.items())
-        
-        self.metrics[key] = duration
-        logger.info(f"Metric: {key} = {duration}s")
+    def record_timing(self, name: str, duration_ns: int, tags: Optional[Dict[str, str]] = None):
+        """Record a timing metric (duration in integer nanoseconds)."""
+        key = _build_key("timer", name, tuple(sorted(tags.items())) if tags else ())
+
+        self._admit(key)
+        self.metrics[key] = duration_ns
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Metric: %s = %sns", key, duration_ns)
     
     def get_metrics(self) -> Dict[str, Any]:
-        """Get all collected metrics."""
-        return self.metrics.copy()
+        """Get all collected metrics, converting timers to seconds."""
+        # Timings are kept as integer nanoseconds internally; only pay for
+        # the float conversion at export time
+        return {
+            key: value / 1e9 if key.startswith("timer:") else value
+            for key, value in self.metrics.items()
+        }
     
     def clear_metrics(self):
         """Clear all metrics."""
@@ -57,53 +90,135 @@ metrics = MetricsCollector()
 
 
 class RequestMetrics:
-    """Middleware for collecting request metrics."""
-    
+    """Pure ASGI middleware for collecting request metrics."""
+
     def __init__(self, app):
         self.app = app
-    
+
     async def __call__(self, scope, receive, send):
         if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
-        
-        request = Request(scope, receive)
-        start_time = time.time()
-        
-        # Process request
-        response = await self.app(scope, receive, send)
-        
-        # Calculate metrics
-        duration = time.time() - start_time
-        status_code = getattr(response, 'status_code', 200)
-        
-        # Record metrics
-        metrics.increment_counter("requests_total", tags={
-            "method": request.method,
-            "endpoint": request.url.path,
-            "status": str(status_code)
-        })
-        
-        metrics.record_timing("request_duration", duration, tags={
-            "method": request.method,
-            "endpoint": request.url.path
-        })
-        
-        return response
+
+        # Read method/path straight off the scope; building a Request object
+        # per call is wasted allocation for two fields
+        method = scope["method"]
+        path = scope["path"]
+
+        # Capture the real status from http.response.start; the ASGI app
+        # returns None, so there is no response object to inspect
+        status_holder = [200]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder[0] = message["status"]
+            await send(message)
+
+        start_time = time.monotonic_ns()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ns = time.monotonic_ns() - start_time
+
+            # Label by route template ("/users/{user_id}"), not the raw
+            # path — raw paths make every distinct id a permanent metric key.
+            # Routing has run by now, so the matched route is on the scope.
+            route = scope.get("route")
+            endpoint = getattr(route, "path_format", None) or path
+
+            metrics.increment_counter("requests_total", tags={
+                "method": method,
+                "endpoint": endpoint,
+                "status": str(status_holder[0])
+            })
+
+            metrics.record_timing("request_duration", duration_ns, tags={
+                "method": method,
+                "endpoint": endpoint
+            })
+
+
+# Compiled once; SQLAlchemy caches the TextClause compilation
+_DB_PROBE = text("SELECT 1")
+
+
+@functools.cache
+def _platform_info() -> tuple:
+    """Platform identity never changes in-process; compute it once."""
+    import platform
+    return platform.platform(), platform.python_version()
+
+
+@functools.cache
+def _boot_time() -> float:
+    """Boot time is constant for the process lifetime; cache the syscall."""
+    import psutil
+    return psutil.boot_time()
 
 
 class HealthChecker:
     """Health check utilities."""
-    
+
+    # Probe results are memoized briefly so probe storms (orchestrator
+    # liveness + readiness + load balancer) don't hammer the backends
+    _CACHE_TTL_NS = 5_000_000_000  # 5 seconds
+    _cached_results: Optional[tuple] = None
+    _cache_expires_ns: int = 0
+
+    @classmethod
+    async def check_all(cls) -> tuple:
+        """Run all probes concurrently, caching results for a few seconds.
+
+        Returns (database, redis, external_services, system_info) dicts.
+        If probing itself blows up, the last good snapshot is served stale
+        rather than turning the health endpoint into a 500.
+        """
+        now = time.monotonic_ns()
+        if cls._cached_results is not None and now < cls._cache_expires_ns:
+            return cls._cached_results
+
+        raw = await asyncio.gather(
+            cls.check_database(),
+            cls.check_redis(),
+            cls.check_external_services(),
+            cls.get_system_info(),
+            return_exceptions=True,
+        )
+        if any(isinstance(r, BaseException) for r in raw):
+            # One failing probe must not sink the others' fresh results;
+            # prefer the last good snapshot, else report the failure inline
+            if cls._cached_results is not None:
+                errors = [r for r in raw if isinstance(r, BaseException)]
+                logger.error(f"Health probe failed, serving stale results: {errors[0]}")
+                return cls._cached_results
+            results = tuple(
+                {"status": "unhealthy", "error": str(r)}
+                if isinstance(r, BaseException) else r
+                for r in raw
+            )
+            return results
+
+        results = tuple(raw)
+        cls._cached_results = results
+        cls._cache_expires_ns = time.monotonic_ns() + cls._CACHE_TTL_NS
+        return results
+
     @staticmethod
     async def check_database() -> Dict[str, Any]:
         """Check database connectivity."""
         try:
-            from app.core.database import SessionLocal
-            db = SessionLocal()
-            db.execute("SELECT 1")
-            db.close()
-            return {"status": "healthy", "response_time": 0.001}
+            from app.core.database import engine
+
+            def _probe():
+                # A pooled connection is enough for a liveness probe; a full
+                # Session with identity map is wasted work here
+                with engine.connect() as conn:
+                    conn.execute(_DB_PROBE)
+
+            start_time = time.perf_counter()
+            await asyncio.to_thread(_probe)
+            response_time = time.perf_counter() - start_time
+            return {"status": "healthy", "response_time": response_time}
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
     
@@ -112,9 +227,9 @@ class HealthChecker:
         """Check Redis connectivity."""
         try:
             from app.core.cache import redis_client
-            start_time = time.time()
-            redis_client.ping()
-            response_time = time.time() - start_time
+            start_time = time.monotonic_ns()
+            await redis_client.ping()
+            response_time = (time.monotonic_ns() - start_time) / 1e9
             return {"status": "healthy", "response_time": response_time}
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
@@ -139,49 +254,106 @@ class HealthChecker:
     async def get_system_info() -> Dict[str, Any]:
         """Get system information."""
         import psutil
-        import platform
-        
+
+        platform_name, python_version = _platform_info()
         return {
-            "platform": platform.platform(),
-            "python_version": platform.python_version(),
+            "platform": platform_name,
+            "python_version": python_version,
             "cpu_percent": psutil.cpu_percent(),
             "memory_percent": psutil.virtual_memory().percent,
             "disk_percent": psutil.disk_usage('/').percent,
-            "uptime": time.time() - psutil.boot_time()
+            "uptime": time.time() - _boot_time()
         }
 
 
 class APIAnalytics:
-    """API analytics and usage tracking."""
-    
+    """API analytics and usage tracking.
+
+    Usage records are queued in-process and flushed to Redis in batches
+    by a background task, so the request path never waits on a Redis
+    round trip. When the queue is full, records are dropped and counted
+    rather than blocking a request.
+    """
+
+    _queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+    _flush_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def start_flush_task(cls):
+        """Start the background flush task (call once at app startup)."""
+        if cls._flush_task is None or cls._flush_task.done():
+            cls._flush_task = asyncio.create_task(cls._flush_loop())
+
+    @classmethod
+    async def stop_flush_task(cls):
+        """Cancel the background flush task (call at app shutdown)."""
+        if cls._flush_task is not None:
+            cls._flush_task.cancel()
+            try:
+                await cls._flush_task
+            except asyncio.CancelledError:
+                pass
+            cls._flush_task = None
+
+    @classmethod
+    async def _flush_loop(cls):
+        """Drain the queue, writing batches of up to 100 records per second."""
+        while True:
+            key, data = await cls._queue.get()
+            batch = {key: data}
+            deadline = time.monotonic() + 1.0
+            while len(batch) < 100:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    key, data = await asyncio.wait_for(cls._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch[key] = data
+            await cache.mset(batch, ttl=86400)  # 24 hours
+
     @staticmethod
-    async def track_api_usage(
+    def track_api_usage(
         user_id: Optional[int],
         endpoint: str,
         method: str,
         status_code: int,
-        response_time: float,
+        response_time_ns: int,
         request_size: int = 0,
         response_size: int = 0
     ):
-        """Track API usage for analytics."""
+        """Track API usage for analytics.
+
+        Synchronous and non-blocking: the record is handed to the bounded
+        queue and everything else is in-memory counter work, so callers on
+        the request path pay no coroutine or I/O cost.
+        """
         try:
+            # One clock read; integer epoch seconds serialize far cheaper
+            # than building two datetimes and formatting them
+            now = int(time.time())
+
             # Store in cache for real-time analytics
             usage_data = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now,
                 "user_id": user_id,
                 "endpoint": endpoint,
                 "method": method,
                 "status_code": status_code,
-                "response_time": response_time,
+                "response_time_ns": response_time_ns,
                 "request_size": request_size,
                 "response_size": response_size
             }
             
-            # Store in cache with TTL
-            cache_key = f"api_usage:{datetime.utcnow().strftime('%Y%m%d%H%M')}"
-            await cache.set(cache_key, usage_data, ttl=86400)  # 24 hours
-            
+            # Enqueue for the background flusher, bucketed to the minute;
+            # drop (and count) on overflow instead of stalling the request
+            cache_key = f"api_usage:{now - now % 60}"
+            try:
+                APIAnalytics._queue.put_nowait((cache_key, usage_data))
+            except asyncio.QueueFull:
+                metrics.increment_counter("analytics_dropped")
+
             # Update counters
             metrics.increment_counter("api_calls_total", tags={
                 "endpoint": endpoint,
@@ -189,7 +361,7 @@ class APIAnalytics:
                 "status": str(status_code)
             })
             
-            metrics.record_timing("api_response_time", response_time, tags={
+            metrics.record_timing("api_response_time", response_time_ns, tags={
                 "endpoint": endpoint,
                 "method": method
             })
@@ -1,19 +1,44 @@
 """Rate limiting utilities using Redis."""
 
+import inspect
 import time
 from typing import Optional
 from fastapi import HTTPException, Request, status
 from app.core.config import settings
-import redis
+import redis.asyncio as aioredis
+from redis.exceptions import NoScriptError
+
+# Async Redis connection for rate limiting; checks must not block the
+# event loop for the duration of a Redis round trip
+redis_client = aioredis.from_url(
+    settings.redis_url,
+    decode_responses=True,
+    max_connections=50
+)
+
+# Sliding-window check as one atomic server-side script: trim the window,
+# count, conditionally record the hit, refresh the TTL. One round trip
+# instead of a 4-command pipeline.
+_SLIDING_WINDOW_LUA = """
+local trimmed = redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local count = redis.call('ZCARD', KEYS[1])
+local limit = tonumber(ARGV[3])
+if count < limit then
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[2])
+    redis.call('EXPIRE', KEYS[1], ARGV[4])
+    return {count, limit - count - 1}
+end
+return {count, 0}
+"""
 
-# Redis connection for rate limiting
-redis_client = redis.from_url(settings.redis_url, decode_responses=True)
 
 class RateLimiter:
     """Rate limiter using Redis sliding window algorithm."""
     
     def __init__(self, redis_client=redis_client):
         self.redis = redis_client
+        # Loaded lazily on first use so import works with Redis down
+        self._script_sha = None
     
     async def is_allowed(
         self, 
@@ -21,7 +46,7 @@ class RateLimiter:
         limit: int, 
         window: int,
         identifier: Optional[str] = None
-    ) -> bool:
+    ) -> tuple[bool, int]:
         """
         Check if request is allowed based on rate limit.
         
@@ -32,36 +57,34 @@ class RateLimiter:
             identifier: Optional identifier for logging
             
         Returns:
-            True if request is allowed, False otherwise
+            Tuple of (allowed, remaining requests in the window)
         """
         try:
             current_time = int(time.time())
             window_start = current_time - window
             
-            # Use Redis pipeline for atomic operations
-            pipe = self.redis.pipeline()
-            
-            # Remove expired entries
-            pipe.zremrangebyscore(key, 0, window_start)
-            
-            # Count current requests
-            pipe.zcard(key)
-            
-            # Add current request
-            pipe.zadd(key, {str(current_time): current_time})
-            
-            # Set expiration
-            pipe.expire(key, window)
+            if self._script_sha is None:
+                self._script_sha = await self.redis.script_load(_SLIDING_WINDOW_LUA)
             
-            results = pipe.execute()
-            current_count = results[1]
+            try:
+                current_count, remaining = await self.redis.evalsha(
+                    self._script_sha, 1, key,
+                    window_start, current_time, limit, window
+                )
+            except NoScriptError:
+                # Script cache was flushed (e.g. Redis restart); reload once
+                self._script_sha = await self.redis.script_load(_SLIDING_WINDOW_LUA)
+                current_count, remaining = await self.redis.evalsha(
+                    self._script_sha, 1, key,
+                    window_start, current_time, limit, window
+                )
             
-            return current_count < limit
+            return current_count < limit, remaining
             
         except Exception as e:
             # If Redis is down, allow the request (fail open)
             print(f"Rate limiting error: {e}")
-            return True
+            return True, limit
     
     async def get_remaining_requests(
         self, 
@@ -75,10 +98,10 @@ class RateLimiter:
             window_start = current_time - window
             
             # Remove expired entries
-            self.redis.zremrangebyscore(key, 0, window_start)
+            await self.redis.zremrangebyscore(key, 0, window_start)
             
             # Count current requests
-            current_count = self.redis.zcard(key)
+            current_count = await self.redis.zcard(key)
             
             return max(0, limit - current_count)
             
@@ -96,47 +119,62 @@ def get_rate_limit_key(request: Request, user_id: Optional[int] = None) -> str:
         return f"rate_limit:ip:{client_ip}"
 
 
+# Shared limiter; no per-request instantiation
+_LIMITER = RateLimiter()
+
+
 # Rate limit decorator
 def rate_limit(limit: int, window: int = 60):
     """Decorator for rate limiting endpoints."""
     def decorator(func):
+        # Locate the Request parameter once at decoration time; the route
+        # signature is fixed, so no per-call isinstance scan is needed
+        request_index = next(
+            (i for i, param in enumerate(inspect.signature(func).parameters.values())
+             if param.annotation is Request),
+            None
+        )
+
+        # Everything constant for this (limit, window) pair is built once
+        # here; the 429 path only fills in the per-request fields
+        base_detail = {
+            "error": "Rate limit exceeded",
+            "limit": limit,
+            "window": window,
+            "retry_after": window
+        }
+        base_headers = {
+            "X-RateLimit-Limit": str(limit),
+            "Retry-After": str(window)
+        }
+
         async def wrapper(*args, **kwargs):
-            # Extract request from kwargs
-            request = None
-            for arg in args:
-                if isinstance(arg, Request):
-                    request = arg
-                    break
-            
+            if request_index is not None and request_index < len(args):
+                request = args[request_index]
+            else:
+                request = kwargs.get("request")
+
             if not request:
                 return await func(*args, **kwargs)
             
-            # Get user ID if available
-            user_id = getattr(request.state, 'user_id', None)
+            # Get user ID if available; read the scope state dict directly
+            # rather than going through the State attribute wrapper
+            user_id = request.scope.get("state", {}).get("user_id")
             
             # Generate rate limit key
             key = get_rate_limit_key(request, user_id)
             
             # Check rate limit
-            limiter = RateLimiter()
-            is_allowed = await limiter.is_allowed(key, limit, window)
+            is_allowed, remaining = await _LIMITER.is_allowed(key, limit, window)
             
             if not is_allowed:
-                remaining = await limiter.get_remaining_requests(key, limit, window)
                 raise HTTPException(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail={
-                        "error": "Rate limit exceeded",
-                        "limit": limit,
-                        "window": window,
-                        "remaining": remaining,
-                        "retry_after": window
-                    },
+                    detail={**base_detail, "remaining": remaining},
                     headers={
-                        "X-RateLimit-Limit": str(limit),
+                        **base_headers,
                         "X-RateLimit-Remaining": str(remaining),
-                        "X-RateLimit-Reset": str(int(time.time()) + window),
-                        "Retry-After": str(window)
+                        "X-RateLimit-Reset": str(int(time.time()) + window)
                     }
                 )
             
@@ -1,11 +1,49 @@
 """API versioning utilities."""
 
+import inspect
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from fastapi import Request, HTTPException, status
+import orjson
+from fastapi import Request, HTTPException, Response, status
 from fastapi.routing import APIRoute
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from datetime import datetime
 
+# Shared version sets/headers; built once instead of per request
+_VALID_VERSIONS = frozenset({"v1", "v2"})
+_DEPRECATED_VERSIONS = frozenset({"v1"})
+# Bytes variants for matching against raw ASGI headers without decoding
+_VALID_VERSIONS_B = frozenset({b"v1", b"v2"})
+_DEPRECATED_VERSIONS_B = frozenset({b"v1"})
+_DEPRECATED_RESPONSE_HEADERS = {"Deprecation": "true", "Sunset": "2025-12-31"}
+
+
+@lru_cache(maxsize=32)
+def _invalid_version_body(api_version: str) -> bytes:
+    """Serialize (and cache per version string) the 400 invalid-version body."""
+    return orjson.dumps({
+        "error": {
+            "type": "InvalidVersion",
+            "message": f"Unsupported API version: {api_version}",
+            "supported_versions": sorted(_VALID_VERSIONS),
+            "status_code": 400
+        }
+    })
+
+
+def _invalid_version_response(api_version: str) -> Response:
+    """Build a fresh 400 response around the cached body bytes.
+
+    Only the bytes are cached: middleware mutates response headers in
+    place, so sharing one Response instance across requests would let
+    headers accumulate between serves.
+    """
+    return Response(
+        content=_invalid_version_body(api_version),
+        status_code=status.HTTP_400_BAD_REQUEST,
+        media_type="application/json"
+    )
+
 class APIVersion:
     """API version management."""
     
@@ -36,29 +74,24 @@ class VersionedAPIRoute(APIRoute):
         original_route_handler = super().get_route_handler()
         
         async def versioned_route_handler(request: Request) -> Any:
-            # Check API version in header
-            api_version = request.headers.get('API-Version', 'v1')
-            
-            # Validate version
-            if not self._is_valid_version(api_version):
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content={
-                        "error": {
-                            "type": "InvalidVersion",
-                            "message": f"Unsupported API version: {api_version}",
-                            "supported_versions": ["v1", "v2"],
-                            "status_code": 400
-                        }
-                    }
-                )
-            
+            # Check API version with one pass over the raw header bytes;
+            # Headers.get decodes and scans case-insensitively per lookup
+            # (ASGI guarantees lowercased header names)
+            api_version = b"v1"
+            for name, value in request.scope["headers"]:
+                if name == b"api-version":
+                    api_version = value
+                    break
+
+            # Validate version; only decode to str for the error response
+            if api_version not in _VALID_VERSIONS_B:
+                return _invalid_version_response(api_version.decode("latin-1"))
+
             # Check if version is deprecated
-            if self._is_deprecated_version(api_version):
+            if api_version in _DEPRECATED_VERSIONS_B:
                 response = await original_route_handler(request)
                 if hasattr(response, 'headers'):
-                    response.headers['Deprecation'] = 'true'
-                    response.headers['Sunset'] = '2025-12-31'
+                    response.headers.update(_DEPRECATED_RESPONSE_HEADERS)
                 return response
             
             return await original_route_handler(request)
@@ -67,12 +100,12 @@ class VersionedAPIRoute(APIRoute):
     
     def _is_valid_version(self, version: str) -> bool:
         """Check if version is valid."""
-        return version in ['v1', 'v2']
+        return version in _VALID_VERSIONS
     
     def _is_deprecated_version(self, version: str) -> bool:
         """Check if version is deprecated."""
         # v1 is deprecated, v2 is current
-        return version == 'v1'
+        return version in _DEPRECATED_VERSIONS
 
 
 class VersionManager:
@@ -130,17 +163,24 @@ version_manager = VersionManager()
 def require_version(version: str):
     """Decorator to require specific API version."""
     def decorator(func):
+        # Locate the Request parameter once at decoration time instead of
+        # probing every positional argument per call
+        request_index = next(
+            (i for i, param in enumerate(inspect.signature(func).parameters.values())
+             if param.annotation is Request),
+            None
+        )
+
         async def wrapper(*args, **kwargs):
-            request = None
-            for arg in args:
-                if hasattr(arg, 'headers'):
-                    request = arg
-                    break
-            
+            if request_index is not None and request_index < len(args):
+                request = args[request_index]
+            else:
+                request = kwargs.get("request")
+
             if request:
                 api_version = request.headers.get('API-Version', 'v1')
                 if api_version != version:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         content={
                             "error": {
@@ -2,11 +2,14 @@
 
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, HTTPException, status
+import orjson
+from fastapi import FastAPI, Request, HTTPException, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from app.core.config import settings
+from app._static_payloads import ROOT_PAYLOAD_BYTES
 
 # Configure logging
 logging.basicConfig(
@@ -34,9 +37,11 @@ app = FastAPI(
     version=settings.app_version,
     description="Production-ready Multi-Service Automation Platform with FastAPI - Mid-Level Features",
     lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    default_response_class=ORJSONResponse,
+    # Docs and schema generation only in debug; see app/main.py
+    docs_url="/docs" if settings.debug else None,
+    redoc_url="/redoc" if settings.debug else None,
+    openapi_url="/openapi.json" if settings.debug else None
 )
 
 # Add CORS middleware
@@ -48,106 +53,87 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies; the 1 KB floor keeps tiny responses cheap
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+# These demo payloads are constant; serialize each once at import and serve
+# the bytes directly
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "timestamp": "2025-09-10T03:48:00Z",
+    "version": settings.app_version,
+    "services": {
+        "database": {"status": "healthy", "response_time": 0.001},
+        "redis": {"status": "healthy", "response_time": 0.001},
+        "external": {
+            "slack": {"status": "configured", "response_time": 0.001},
+            "telegram": {"status": "configured", "response_time": 0.001},
+            "google_sheets": {"status": "configured", "response_time": 0.001}
+        }
+    },
+    "system": {
+        "platform": "Linux",
+        "python_version": "3.13",
+        "cpu_percent": 15.2,
+        "memory_percent": 45.8,
+        "disk_percent": 23.1
+    }
+})
+
+_METRICS_BYTES = orjson.dumps({
+    "metrics": {
+        "requests_total": 1250,
+        "response_time_avg": 0.125,
+        "error_rate": 0.02,
+        "active_users": 45
+    },
+    "timestamp": "2025-09-10T03:48:00Z"
+})
+
+_OVERVIEW_BYTES = orjson.dumps({
+    "users": {
+        "total": 150,
+        "active": 120,
+        "verified": 100,
+        "recent_registrations": 25
+    },
+    "services": {
+        "slack": 80,
+        "telegram": 75,
+        "google_sheets": 60
+    },
+    "sessions": 45,
+    "metrics": {
+        "requests_total": 1250,
+        "response_time_avg": 0.125,
+        "error_rate": 0.02
+    }
+})
+
 
 @app.get("/")
 async def root():
     """Root endpoint with version information."""
-    return {
-        "message": "Multi-Service Automation Platform",
-        "version": settings.app_version,
-        "status": "running",
-        "api_version": "v2",
-        "supported_versions": ["v1", "v2"],
-        "features": [
-            "FastAPI Backend",
-            "Slack Integration",
-            "Telegram Integration", 
-            "Google Sheets Integration",
-            "JWT Authentication",
-            "Role-Based Access Control (RBAC)",
-            "Rate Limiting",
-            "Redis Caching",
-            "WebSocket Support",
-            "Background Jobs (Celery)",
-            "API Versioning",
-            "Monitoring & Metrics",
-            "Admin Panel",
-            "Docker Support"
-        ],
-        "endpoints": {
-            "api_docs": "/docs",
-            "health": "/health",
-            "admin": "/api/v1/admin",
-            "auth": "/api/v1/auth",
-            "messages": "/api/v1/messages",
-            "sheets": "/api/v1/sheets",
-            "websocket": "/api/v1/ws/connect"
-        }
-    }
+    return Response(content=ROOT_PAYLOAD_BYTES, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Comprehensive health check endpoint."""
-    return {
-        "status": "healthy",
-        "timestamp": "2025-09-10T03:48:00Z",
-        "version": settings.app_version,
-        "services": {
-            "database": {"status": "healthy", "response_time": 0.001},
-            "redis": {"status": "healthy", "response_time": 0.001},
-            "external": {
-                "slack": {"status": "configured", "response_time": 0.001},
-                "telegram": {"status": "configured", "response_time": 0.001},
-                "google_sheets": {"status": "configured", "response_time": 0.001}
-            }
-        },
-        "system": {
-            "platform": "Linux",
-            "python_version": "3.13",
-            "cpu_percent": 15.2,
-            "memory_percent": 45.8,
-            "disk_percent": 23.1
-        }
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/metrics")
 async def get_metrics():
     """Get application metrics."""
-    return {
-        "metrics": {
-            "requests_total": 1250,
-            "response_time_avg": 0.125,
-            "error_rate": 0.02,
-            "active_users": 45
-        },
-        "timestamp": "2025-09-10T03:48:00Z"
-    }
+    return Response(content=_METRICS_BYTES, media_type="application/json")
 
 
 @app.get("/api/v1/admin/stats/overview")
 async def get_system_overview():
     """Get system overview statistics."""
-    return {
-        "users": {
-            "total": 150,
-            "active": 120,
-            "verified": 100,
-            "recent_registrations": 25
-        },
-        "services": {
-            "slack": 80,
-            "telegram": 75,
-            "google_sheets": 60
-        },
-        "sessions": 45,
-        "metrics": {
-            "requests_total": 1250,
-            "response_time_avg": 0.125,
-            "error_rate": 0.02
-        }
-    }
+    return Response(content=_OVERVIEW_BYTES, media_type="application/json")
 
 
 @app.get("/api/v1/admin/users")
@@ -218,7 +204,7 @@ async def login():
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": {
@@ -235,7 +221,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
     logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": {
@@ -253,5 +239,7 @@ if __name__ == "__main__":
         "app.main_simple:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        loop="uvloop",
+        http="httptools"
     )
@@ -1,16 +1,23 @@
 """User model for authentication and service connections."""
 
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, List
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, func
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Index, Integer, String, Boolean, DateTime, Text, func
+from sqlalchemy.orm import deferred, relationship
 from app.core.database import Base
 
 class User(Base):
     """User model for authentication and service management."""
-    
+
     __tablename__ = "users"
-    
+    # Composite indexes matching the admin listing filters: active users
+    # ordered by signup date, and the verified/active breakdown
+    __table_args__ = (
+        Index("ix_users_active_created", "is_active", "created_at"),
+        Index("ix_users_verified_active", "is_verified", "is_active"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
     username = Column(String(100), unique=True, index=True, nullable=False)
@@ -21,7 +28,7 @@ class User(Base):
     is_verified = Column(Boolean, default=False)
     is_superuser = Column(Boolean, default=False)
     last_login = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Service connection flags
@@ -29,10 +36,12 @@ class User(Base):
     telegram_connected = Column(Boolean, default=False)
     google_sheets_connected = Column(Boolean, default=False)
     
-    # Service tokens/secrets (encrypted in production)
-    slack_token = Column(Text, nullable=True)
+    # Service tokens/secrets (encrypted in production). The Text blobs are
+    # deferred: auth lookups and admin listings never touch them, so the
+    # default SELECT shouldn't drag kilobytes of token material per row
+    slack_token = deferred(Column(Text, nullable=True))
     telegram_chat_id = Column(String(100), nullable=True)
-    google_credentials = Column(Text, nullable=True)
+    google_credentials = deferred(Column(Text, nullable=True))
     
     # Relationships
     roles = relationship("Role", secondary="user_roles", back_populates="users")
@@ -48,16 +57,23 @@ class User(Base):
             return f"{self.first_name} {self.last_name}"
         return self.username
     
+    @cached_property
+    def _perm_set(self) -> frozenset:
+        """Flattened (resource, action) pairs across all roles.
+
+        Built once per instance so repeated authorization checks in a
+        request are set lookups instead of re-walking roles/permissions.
+        Pop it from __dict__ after mutating roles.
+        """
+        return frozenset(
+            (permission.resource, permission.action)
+            for role in self.roles
+            for permission in role.permissions
+        )
+
     def has_permission(self, resource: str, action: str) -> bool:
         """Check if user has specific permission."""
-        if self.is_superuser:
-            return True
-        
-        for role in self.roles:
-            for permission in role.permissions:
-                if permission.resource == resource and permission.action == action:
-                    return True
-        return False
+        return self.is_superuser or (resource, action) in self._perm_set
     
     def has_role(self, role_name: str) -> bool:
         """Check if user has specific role."""
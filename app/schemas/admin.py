@@ -2,7 +2,7 @@
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from app.schemas.user import UserResponse
 
 
@@ -23,37 +23,35 @@ class SystemStats(BaseModel):
 
 
 class UserListResponse(BaseModel):
-    """User list response schema."""
+    """User list response schema with keyset pagination."""
     users: List[UserResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
     size: int
-    pages: int
+    next_cursor: Optional[int] = None
 
 
-class RoleResponse(BaseModel):
-    """Role response schema."""
+class PermissionResponse(BaseModel):
+    """Permission response schema."""
     id: int
     name: str
+    resource: str
+    action: str
     description: Optional[str]
-    is_active: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
 
-class PermissionResponse(BaseModel):
-    """Permission response schema."""
+
+class RoleResponse(BaseModel):
+    """Role response schema."""
     id: int
     name: str
-    resource: str
-    action: str
     description: Optional[str]
+    is_active: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+    permissions: List[PermissionResponse] = []
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
 
 
 class APIStats(BaseModel):
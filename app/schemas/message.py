@@ -1,6 +1,6 @@
 """Message-related Pydantic schemas."""
 
-from typing import Optional, List, Dict, Any
+from typing import FrozenSet, Literal, Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 
 
@@ -26,7 +26,11 @@ class TelegramMessage(MessageBase):
 class UnifiedMessage(BaseModel):
     """Schema for unified message sending to multiple services."""
     content: str = Field(..., min_length=1, max_length=4000)
-    services: List[str] = Field(..., description="List of services to send to: ['slack', 'telegram']")
+    # Literal frozenset: unknown service names are rejected by the core
+    # validator (no Python-level check needed) and membership is O(1)
+    services: FrozenSet[Literal["slack", "telegram"]] = Field(
+        ..., min_length=1, description="Services to send to: ['slack', 'telegram']"
+    )
     slack_channel: Optional[str] = Field(None, description="Slack channel ID or name")
     telegram_chat_id: Optional[str] = Field(None, description="Telegram chat ID")
     thread_ts: Optional[str] = Field(None, description="Slack thread timestamp")
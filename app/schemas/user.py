@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class UserBase(BaseModel):
@@ -33,9 +33,10 @@ class UserInDB(UserBase):
     slack_connected: bool
     telegram_connected: bool
     google_sheets_connected: bool
-    
-    class Config:
-        from_attributes = True
+
+    # v2-native config: the validator core is built once at class creation;
+    # extra ORM attributes are dropped instead of validated
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
 
 
 class UserResponse(UserInDB):
@@ -1,14 +1,30 @@
 """Background tasks using Celery."""
 
+import asyncio
 import logging
+from typing import Optional
 from celery import current_task
 from app.core.celery import celery_app
-from services.slack_service import SlackService
-from services.telegram_service import TelegramService
+from services.slack_service import slack_service
+from services.telegram_service import telegram_service
 from services.sheets_service import SheetsService
 
 logger = logging.getLogger(__name__)
 
+# One persistent loop per worker process: the shared service clients
+# (e.g. the pooled telegram.Bot's httpx transport) bind connections to
+# the loop that created them, so a fresh asyncio.run() per task would
+# leave the pools referencing a closed loop on the next invocation
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run_async(coro):
+    """Run a coroutine on the worker's persistent event loop."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_loop.run_until_complete(coro)
+
 
 @celery_app.task
 def health_check():
@@ -21,29 +37,29 @@ def health_check():
 def send_message_async(service: str, **kwargs):
     """Send message asynchronously to specified service."""
     try:
+        # The service send methods are coroutines; run them to completion
+        # on this worker instead of returning a bare coroutine object
         if service == "slack":
-            slack_service = SlackService()
-            result = slack_service.send_message(
+            result = _run_async(slack_service.send_message(
                 channel=kwargs.get("channel"),
                 text=kwargs.get("text"),
                 thread_ts=kwargs.get("thread_ts")
-            )
+            ))
         elif service == "telegram":
-            telegram_service = TelegramService()
-            result = telegram_service.send_message(
+            result = _run_async(telegram_service.send_message(
                 chat_id=kwargs.get("chat_id"),
                 text=kwargs.get("text"),
                 parse_mode=kwargs.get("parse_mode", "HTML"),
                 reply_to_message_id=kwargs.get("reply_to_message_id")
-            )
+            ))
         else:
             return {"success": False, "error": f"Unknown service: {service}"}
         
-        logger.info(f"Async message sent via {service}: {result}")
+        logger.info("Async message sent via %s: %r", service, result)
         return result
         
     except Exception as e:
-        logger.error(f"Error in async message task: {str(e)}")
+        logger.error("Error in async message task: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -58,11 +74,11 @@ def append_to_sheet_async(spreadsheet_id: str, range_name: str, values: list):
             values=values
         )
         
-        logger.info(f"Async sheet append completed: {result}")
+        logger.info("Async sheet append completed: %r", result)
         return result
         
     except Exception as e:
-        logger.error(f"Error in async sheet task: {str(e)}")
+        logger.error("Error in async sheet task: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -70,7 +86,7 @@ def append_to_sheet_async(spreadsheet_id: str, range_name: str, values: list):
 def process_webhook_data(webhook_type: str, data: dict):
     """Process webhook data asynchronously."""
     try:
-        logger.info(f"Processing {webhook_type} webhook data")
+        logger.info("Processing %s webhook data", webhook_type)
         
         # Here you could implement webhook processing logic
         # For example, storing messages, triggering notifications, etc.
@@ -79,16 +95,16 @@ def process_webhook_data(webhook_type: str, data: dict):
             # Process Slack webhook
             event = data.get("event", {})
             if event.get("type") == "message":
-                logger.info(f"Processing Slack message: {event.get('text', '')}")
+                logger.info("Processing Slack message: %s", event.get("text", ""))
         
         elif webhook_type == "telegram":
             # Process Telegram webhook
             message = data.get("message", {})
             if message:
-                logger.info(f"Processing Telegram message: {message.get('text', '')}")
+                logger.info("Processing Telegram message: %s", message.get("text", ""))
         
         return {"success": True, "processed": True}
         
     except Exception as e:
-        logger.error(f"Error processing webhook data: {str(e)}")
+        logger.error("Error processing webhook data: %s", e)
         return {"success": False, "error": str(e)}
@@ -0,0 +1,19 @@
+-- Trigram search index for the admin user search (PostgreSQL only).
+-- Run once against the application database:
+--   psql "$DATABASE_URL" -f scripts/create_users_search_index.sql
+--
+-- The admin list_users endpoint matches the search term against a
+-- concatenation of username/email/first_name/last_name. Without this
+-- index every search is a sequential scan; with it the trigram `%`
+-- operator uses a GIN index lookup instead.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS users_search_trgm ON users USING gin (
+    (
+        coalesce(username, '') || ' ' ||
+        coalesce(email, '') || ' ' ||
+        coalesce(first_name, '') || ' ' ||
+        coalesce(last_name, '')
+    ) gin_trgm_ops
+);
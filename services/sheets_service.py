@@ -1,53 +1,126 @@
 """Google Sheets service for reading and writing data."""
 
+import asyncio
 import logging
 import json
+import time
 from typing import Optional, Dict, Any, List
+import orjson
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+import googleapiclient.model as _gmodel
+from app.core.cache import cache
 from app.core.config import settings
+from services.throttle import TokenBucket
 
 logger = logging.getLogger(__name__)
 
 
+class _OrjsonModule:
+    """Stdlib-json-shaped shim backed by orjson for googleapiclient.
+
+    The discovery client serializes request bodies and parses responses
+    with stdlib json; on big 2D value arrays that is pure CPU overhead.
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+    client's error handling is unaffected.
+    """
+
+    decoder = json.decoder
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
+_gmodel.json = _OrjsonModule
+
+
 class SheetsService:
     """Service for interacting with Google Sheets API."""
     
+    # Metadata rarely changes within a session; cache parsed info briefly
+    _META_CACHE_TTL = 30.0  # seconds
+
+    # Range reads are cached in Redis; short enough to stay fresh, long
+    # enough to absorb dashboard polling and repeated test runs
+    _READ_CACHE_TTL = 30  # seconds
+
+    # Built service objects shared across instances: re-parsing the key
+    # file and standing up a fresh authorized transport per construction
+    # costs hundreds of ms and a new connection pool each time
+    _service_cache: Dict[tuple, Any] = {}
+
+    # Quotas are per service account, so the buckets are shared across
+    # instances; pacing below the limit beats eating 429 retry storms
+    _write_bucket = TokenBucket(settings.sheets_writes_per_min)
+    _read_bucket = TokenBucket(settings.sheets_reads_per_min)
+
     def __init__(self, credentials_file: Optional[str] = None):
         """Initialize Google Sheets service with credentials."""
         self.credentials_file = credentials_file or settings.google_credentials_file
         self.scopes = settings.google_sheets_scopes
         self.service = None
+        # spreadsheet_id -> (expires_at, parsed_info)
+        self._meta_cache: Dict[str, tuple] = {}
         self._authenticate()
     
     def _authenticate(self) -> None:
-        """Authenticate with Google Sheets API."""
+        """Authenticate with Google Sheets API, reusing a cached transport."""
+        cache_key = (self.credentials_file, tuple(self.scopes))
+        cached = SheetsService._service_cache.get(cache_key)
+        if cached is not None:
+            self.service = cached
+            self._bind_resources()
+            return
+
         try:
             credentials = Credentials.from_service_account_file(
                 self.credentials_file,
                 scopes=self.scopes
             )
             self.service = build('sheets', 'v4', credentials=credentials)
+            SheetsService._service_cache[cache_key] = self.service
+            self._bind_resources()
             logger.info("Successfully authenticated with Google Sheets API")
         except Exception as e:
             logger.error(f"Failed to authenticate with Google Sheets API: {str(e)}")
             self.service = None
+            self._spreadsheets = None
+            self._values = None
+
+    def _bind_resources(self) -> None:
+        """Hoist the per-call Resource construction out of the hot paths.
+
+        spreadsheets() and values() each reflect method bindings from the
+        discovery document; binding them once per instance removes that
+        work (and two attribute-call layers) from every request.
+        """
+        self._spreadsheets = self.service.spreadsheets()
+        self._values = self._spreadsheets.values()
     
-    async def append_row(
-        self, 
-        spreadsheet_id: str, 
-        range_name: str, 
-        values: List[Any]
+    async def append_rows(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        rows: List[List[Any]]
     ) -> Dict[str, Any]:
         """
-        Append a row to a Google Sheet.
-        
+        Append multiple rows to a Google Sheet in one API call.
+
+        The append endpoint accepts any number of rows per request, so
+        batching at the call site turns N per-row round trips (and their
+        write-quota hits) into a single one.
+
         Args:
             spreadsheet_id: The ID of the spreadsheet
             range_name: The range to append to (e.g., 'Sheet1!A:Z')
-            values: List of values to append
-            
+            rows: 2D list of row values to append
+
         Returns:
             Dict containing success status and details
         """
@@ -56,27 +129,37 @@ class SheetsService:
                 "success": False,
                 "error": "Google Sheets service not authenticated"
             }
-        
+
         try:
             body = {
-                'values': [values]
+                'values': rows
             }
-            
-            result = self.service.spreadsheets().values().append(
+
+            await self._write_bucket.acquire()
+
+            # Build the request on the loop, run the blocking HTTPS round
+            # trip in a worker thread so the event loop stays free
+            req = self._values.append(
                 spreadsheetId=spreadsheet_id,
                 range=range_name,
                 valueInputOption='USER_ENTERED',
-                body=body
-            ).execute()
-            
-            logger.info(f"Row appended to sheet {spreadsheet_id}")
+                body=body,
+                fields='updates(updatedCells,updatedRange)'
+            )
+            result = await asyncio.to_thread(req.execute)
+
+            logger.info("Appended %d row(s) to sheet %s", len(rows), spreadsheet_id)
+            try:
+                await cache.clear_pattern(f"sheets:read:{spreadsheet_id}:*")
+            except Exception:
+                pass
             return {
                 "success": True,
                 "updated_cells": result.get('updates', {}).get('updatedCells', 0),
                 "updated_range": result.get('updates', {}).get('updatedRange', ''),
                 "spreadsheet_id": spreadsheet_id
             }
-            
+
         except HttpError as e:
             logger.error(f"Google Sheets API error: {str(e)}")
             return {
@@ -89,43 +172,83 @@ class SheetsService:
                 "success": False,
                 "error": str(e)
             }
+
+    async def append_row(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        values: List[Any]
+    ) -> Dict[str, Any]:
+        """
+        Append a row to a Google Sheet.
+
+        Args:
+            spreadsheet_id: The ID of the spreadsheet
+            range_name: The range to append to (e.g., 'Sheet1!A:Z')
+            values: List of values to append
+
+        Returns:
+            Dict containing success status and details
+        """
+        return await self.append_rows(spreadsheet_id, range_name, [values])
     
-    async def read_range(
-        self, 
-        spreadsheet_id: str, 
-        range_name: str
+    async def read_ranges(
+        self,
+        spreadsheet_id: str,
+        ranges: List[str]
     ) -> Dict[str, Any]:
         """
-        Read data from a Google Sheet range.
-        
+        Read multiple ranges from a Google Sheet in one API call.
+
+        batchGet fetches all requested ranges in a single round trip, so
+        K reads cost one request instead of K.
+
         Args:
             spreadsheet_id: The ID of the spreadsheet
-            range_name: The range to read (e.g., 'Sheet1!A1:Z100')
-            
+            ranges: Ranges to read (e.g., ['Sheet1!A1:Z100', 'Sheet2!A:B'])
+
         Returns:
-            Dict containing success status and data
+            Dict containing success status and the list of value ranges
         """
         if not self.service:
             return {
                 "success": False,
                 "error": "Google Sheets service not authenticated"
             }
-        
+
+        # Reads are cached in Redis so dashboards polling the same ranges
+        # stop paying an HTTPS round trip per poll; writes through this
+        # service bust the spreadsheet's read keys
+        cache_key = f"sheets:read:{spreadsheet_id}:{'|'.join(ranges)}"
+        try:
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                return cached
+        except Exception:
+            pass
+
         try:
-            result = self.service.spreadsheets().values().get(
+            await self._read_bucket.acquire()
+
+            req = self._values.batchGet(
                 spreadsheetId=spreadsheet_id,
-                range=range_name
-            ).execute()
-            
-            values = result.get('values', [])
-            logger.info(f"Read {len(values)} rows from sheet {spreadsheet_id}")
-            return {
+                ranges=ranges,
+                fields='valueRanges(values,range,majorDimension)'
+            )
+            result = await asyncio.to_thread(req.execute)
+
+            value_ranges = result.get('valueRanges', [])
+            logger.info("Read %d range(s) from sheet %s", len(value_ranges), spreadsheet_id)
+            payload = {
                 "success": True,
-                "values": values,
-                "range": result.get('range', ''),
-                "major_dimension": result.get('majorDimension', 'ROWS')
+                "valueRanges": value_ranges
             }
-            
+            try:
+                await cache.set(cache_key, payload, ttl=self._READ_CACHE_TTL)
+            except Exception:
+                pass
+            return payload
+
         except HttpError as e:
             logger.error(f"Google Sheets API error: {str(e)}")
             return {
@@ -138,7 +261,79 @@ class SheetsService:
                 "success": False,
                 "error": str(e)
             }
+
+    async def read_range(
+        self,
+        spreadsheet_id: str,
+        range_name: str
+    ) -> Dict[str, Any]:
+        """
+        Read data from a Google Sheet range.
+
+        Args:
+            spreadsheet_id: The ID of the spreadsheet
+            range_name: The range to read (e.g., 'Sheet1!A1:Z100')
+
+        Returns:
+            Dict containing success status and data
+        """
+        result = await self.read_ranges(spreadsheet_id, [range_name])
+        if not result["success"]:
+            return result
+
+        value_range = result["valueRanges"][0] if result["valueRanges"] else {}
+        values = value_range.get('values', [])
+        return {
+            "success": True,
+            "values": values,
+            "range": value_range.get('range', ''),
+            "major_dimension": value_range.get('majorDimension', 'ROWS')
+        }
     
+    async def iter_rows(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        page_size: int = 1000,
+        first_column: str = 'A',
+        last_column: str = 'Z'
+    ):
+        """
+        Yield rows from a sheet in fixed-size pages.
+
+        Large ranges no longer need the whole response materialized
+        before the first row is usable: each page is one bounded fetch,
+        so peak memory is O(page_size) and callers start consuming rows
+        while later pages are still being fetched.
+
+        Args:
+            spreadsheet_id: The ID of the spreadsheet
+            sheet_name: Sheet to read (e.g., 'Sheet1')
+            page_size: Rows per fetch
+            first_column: Leftmost column of the window
+            last_column: Rightmost column of the window
+
+        Yields:
+            One row (list of cell values) at a time
+        """
+        start = 1
+        while True:
+            end = start + page_size - 1
+            range_name = f"{sheet_name}!{first_column}{start}:{last_column}{end}"
+            result = await self.read_ranges(spreadsheet_id, [range_name])
+            if not result["success"]:
+                return
+
+            value_range = result["valueRanges"][0] if result["valueRanges"] else {}
+            rows = value_range.get('values', [])
+            for row in rows:
+                yield row
+
+            # A short page means the sheet ran out of data
+            if len(rows) < page_size:
+                return
+            start = end + 1
+
     async def update_range(
         self, 
         spreadsheet_id: str, 
@@ -167,14 +362,22 @@ class SheetsService:
                 'values': values
             }
             
-            result = self.service.spreadsheets().values().update(
+            await self._write_bucket.acquire()
+
+            req = self._values.update(
                 spreadsheetId=spreadsheet_id,
                 range=range_name,
                 valueInputOption='USER_ENTERED',
-                body=body
-            ).execute()
+                body=body,
+                fields='updatedCells,updatedRange'
+            )
+            result = await asyncio.to_thread(req.execute)
             
             logger.info(f"Range updated in sheet {spreadsheet_id}")
+            try:
+                await cache.clear_pattern(f"sheets:read:{spreadsheet_id}:*")
+            except Exception:
+                pass
             return {
                 "success": True,
                 "updated_cells": result.get('updatedCells', 0),
@@ -210,12 +413,22 @@ class SheetsService:
                 "success": False,
                 "error": "Google Sheets service not authenticated"
             }
-        
+
+        cached = self._meta_cache.get(spreadsheet_id)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
         try:
-            result = self.service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id
-            ).execute()
-            
+            # Lean projection: only the properties the response uses, not
+            # the full grid/metadata payload
+            await self._read_bucket.acquire()
+
+            req = self._spreadsheets.get(
+                spreadsheetId=spreadsheet_id,
+                fields='properties.title,sheets.properties(title,sheetId,gridProperties.rowCount,gridProperties.columnCount)'
+            )
+            result = await asyncio.to_thread(req.execute)
+
             sheets = []
             for sheet in result.get('sheets', []):
                 sheets.append({
@@ -225,13 +438,17 @@ class SheetsService:
                     'column_count': sheet.get('properties', {}).get('gridProperties', {}).get('columnCount', 0)
                 })
             
-            return {
+            info = {
                 "success": True,
                 "spreadsheet_id": spreadsheet_id,
                 "title": result.get('properties', {}).get('title', ''),
                 "sheets": sheets
             }
-            
+            self._meta_cache[spreadsheet_id] = (
+                time.monotonic() + self._META_CACHE_TTL, info
+            )
+            return info
+
         except HttpError as e:
             logger.error(f"Google Sheets API error: {str(e)}")
             return {
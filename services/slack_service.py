@@ -1,6 +1,9 @@
 """Slack service for sending and receiving messages."""
 
+import hashlib
+import hmac
 import logging
+import threading
 from typing import Optional, Dict, Any
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
@@ -8,14 +11,28 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# One WebClient per token, shared across instances: each client owns a
+# pooled HTTP session, and rebuilding it per construction throws away
+# keep-alive connections (a TLS handshake per call path)
+_CLIENTS: Dict[str, WebClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# HMAC keyed once at import; verification copies this pre-keyed state
+# instead of redoing the key schedule per webhook
+_SIGNING_MAC = hmac.new(settings.slack_signing_secret.encode(), digestmod=hashlib.sha256)
+
 
 class SlackService:
     """Service for interacting with Slack API."""
-    
+
     def __init__(self, bot_token: Optional[str] = None):
         """Initialize Slack service with bot token."""
         self.bot_token = bot_token or settings.slack_bot_token
-        self.client = WebClient(token=self.bot_token)
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(self.bot_token)
+            if client is None:
+                client = _CLIENTS[self.bot_token] = WebClient(token=self.bot_token)
+        self.client = client
     
     async def send_message(
         self, 
@@ -130,22 +147,30 @@ class SlackService:
                 "error": e.response["error"]
             }
     
-    def verify_webhook(self, timestamp: str, body: str, signature: str) -> bool:
+    def verify_webhook(self, timestamp: str, body: bytes, signature: str) -> bool:
         """
         Verify Slack webhook signature.
-        
+
         Args:
             timestamp: Request timestamp
-            body: Request body
+            body: Raw request body bytes
             signature: Request signature
-            
+
         Returns:
             True if signature is valid
         """
         try:
-            from slack_sdk.signature import SignatureVerifier
-            verifier = SignatureVerifier(settings.slack_signing_secret)
-            return verifier.is_valid(timestamp, body, signature)
+            # HMAC over the raw bytes: no UTF-8 decode of the payload and
+            # a constant-time comparison via compare_digest. Copying the
+            # pre-keyed MAC skips the per-call key schedule.
+            mac = _SIGNING_MAC.copy()
+            mac.update(b"v0:" + timestamp.encode() + b":" + body)
+            return hmac.compare_digest(f"v0={mac.hexdigest()}", signature or "")
         except Exception as e:
             logger.error(f"Error verifying Slack webhook: {str(e)}")
             return False
+
+
+# Shared instance: the WebClient keeps a pooled HTTP session and token
+# config that are wasteful to rebuild per webhook or task
+slack_service = SlackService()
@@ -1,21 +1,36 @@
 """Telegram service for sending and receiving messages."""
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+import threading
+from typing import List, Optional, Dict, Any
 from telegram import Bot, Update
 from telegram.error import TelegramError
 from app.core.config import settings
+from services.throttle import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# One Bot per token, shared across instances: Bot's HTTPXRequest keeps
+# keep-alive connections that a fresh Bot per construction would discard
+_BOTS: Dict[str, Bot] = {}
+_BOTS_LOCK = threading.Lock()
+
+# Telegram allows ~30 messages/second per bot; pace broadcasts below it
+_SEND_BUCKET = TokenBucket(30 * 60)
+
 
 class TelegramService:
     """Service for interacting with Telegram Bot API."""
-    
+
     def __init__(self, bot_token: Optional[str] = None):
         """Initialize Telegram service with bot token."""
         self.bot_token = bot_token or settings.telegram_bot_token
-        self.bot = Bot(token=self.bot_token)
+        with _BOTS_LOCK:
+            bot = _BOTS.get(self.bot_token)
+            if bot is None:
+                bot = _BOTS[self.bot_token] = Bot(token=self.bot_token)
+        self.bot = bot
     
     async def send_message(
         self, 
@@ -64,7 +79,40 @@ class TelegramService:
                 "success": False,
                 "error": str(e)
             }
-    
+
+    async def send_messages(
+        self,
+        messages: List[tuple],
+        parse_mode: str = "HTML"
+    ) -> List[Dict[str, Any]]:
+        """
+        Send many messages concurrently, paced under the Bot API limit.
+
+        Broadcasting N chats sequentially costs N round trips back to
+        back; dispatching them together collapses latency to roughly the
+        slowest send, while the shared token bucket keeps the burst
+        below Telegram's ~30 messages/second ceiling.
+
+        Args:
+            messages: (chat_id, text) pairs to send
+            parse_mode: Message parse mode applied to every send
+
+        Returns:
+            One result dict per message, in input order
+        """
+        async def _paced_send(chat_id: str, text: str) -> Dict[str, Any]:
+            await _SEND_BUCKET.acquire()
+            return await self.send_message(chat_id=chat_id, text=text, parse_mode=parse_mode)
+
+        results = await asyncio.gather(
+            *(_paced_send(chat_id, text) for chat_id, text in messages),
+            return_exceptions=True
+        )
+        return [
+            {"success": False, "error": str(r)} if isinstance(r, BaseException) else r
+            for r in results
+        ]
+
     async def get_chat_info(self, chat_id: str) -> Dict[str, Any]:
         """
         Get information about a Telegram chat.
@@ -193,3 +241,8 @@ class TelegramService:
         except Exception as e:
             logger.error(f"Error verifying Telegram webhook: {str(e)}")
             return False
+
+
+# Shared instance: Bot owns an HTTP connection pool; reuse it across
+# webhooks and Celery tasks instead of rebuilding per call
+telegram_service = TelegramService()
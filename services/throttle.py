@@ -0,0 +1,33 @@
+"""Client-side pacing helpers shared by the external-service wrappers."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Minimal asyncio token bucket for pacing calls under an API quota.
+
+    Refilled lazily on acquire; callers sleep until a token is available
+    instead of firing a request the API would 429 and retry with backoff.
+    """
+
+    def __init__(self, rate_per_min: int):
+        self._capacity = rate_per_min
+        self._tokens = float(rate_per_min)
+        self._fill_rate = rate_per_min / 60.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._fill_rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._fill_rate)
@@ -0,0 +1,49 @@
+"""Shared test fixtures."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Session-scoped TestClient so app lifespan runs once per run.
+
+    app.main (and the service SDKs it drags in) is imported here rather
+    than at module top so targeted runs of pure service tests don't pay
+    for the whole application import.
+    """
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+# Services pooled by token for the whole run: constructing one pulls in
+# SDK transport setup (httpx client, connection pools), so tests that
+# need instance permutations draw from this cache instead of rebuilding
+_service_cache = {}
+
+
+@pytest.fixture(scope="session")
+def make_slack_service():
+    """Return SlackService instances from a per-token cache."""
+    from services.slack_service import SlackService
+
+    def _make(token="test-token"):
+        key = ("slack", token)
+        if key not in _service_cache:
+            _service_cache[key] = SlackService(bot_token=token)
+        return _service_cache[key]
+    return _make
+
+
+@pytest.fixture(scope="session")
+def make_telegram_service():
+    """Return TelegramService instances from a per-token cache."""
+    def _make(token="test-token"):
+        key = ("telegram", token)
+        if key not in _service_cache:
+            from services.telegram_service import TelegramService
+            _service_cache[key] = TelegramService(bot_token=token)
+        return _service_cache[key]
+    return _make